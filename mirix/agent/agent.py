@@ -9,7 +9,6 @@ import shutil
 import traceback
 import warnings
 import requests
-import numpy as np
 from datetime import datetime
 from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple, Union, Callable
@@ -24,7 +23,6 @@ from mirix.constants import (
     LLM_MAX_TOKENS,
     REQ_HEARTBEAT_MESSAGE,
     CLEAR_HISTORY_AFTER_MEMORY_UPDATE,
-    MAX_EMBEDDING_DIM,
     MAX_RETRIEVAL_LIMIT_IN_SYSTEM,
     MAX_CHAINING_STEPS
 )
@@ -69,7 +67,7 @@ from mirix.services.step_manager import StepManager
 from mirix.services.user_manager import UserManager
 from mirix.services.tool_execution_sandbox import ToolExecutionSandbox
 from mirix.settings import summarizer_settings
-from mirix.embeddings import embedding_model
+from mirix.embeddings import cached_query_embedding
 from mirix.system import get_contine_chaining, get_token_limit_warning, package_function_response, package_summarize_message, package_user_message
 from mirix.tracing import log_event, trace_method
 from mirix.llm_api.llm_client import LLMClient
@@ -1162,9 +1160,7 @@ class Agent(BaseAgent):
 
         # Prepare embedding for semantic search
         if key_words != '' and search_method == 'embedding':
-            embedded_text = embedding_model(self.agent_state.embedding_config).get_text_embedding(key_words)
-            embedded_text = np.array(embedded_text)
-            embedded_text = np.pad(embedded_text, (0, MAX_EMBEDDING_DIM - embedded_text.shape[0]), mode="constant").tolist()
+            embedded_text = cached_query_embedding(self.agent_state.embedding_config, key_words)
         else:
             embedded_text = None
 
@@ -8,16 +8,12 @@ import uuid
 import copy
 import pytz
 import openai
-import base64
 import tiktoken
 import traceback
 import warnings
 import threading
 import numpy as np
-import speech_recognition as sr
-from pydub import AudioSegment
 from tqdm import tqdm
-from google import genai
 from functools import partial
 from dotenv import load_dotenv
 from datetime import datetime, timezone
@@ -48,10 +44,6 @@ from mirix.settings import model_settings
 
 logging.basicConfig(level=logging.INFO, format='[%(name)s] %(levelname)s: %(message)s')
 
-def encode_image(image_path):
-    with open(image_path, "rb") as img_file:
-        return base64.b64encode(img_file.read()).decode("utf-8")
-
 def get_image_mime_type(image_path):
     """
     Detect the MIME type of an image file.
@@ -426,6 +418,7 @@ class AgentWrapper():
             return False
             
         try:
+            from google import genai
             self.google_client = genai.Client(api_key=gemini_api_key)
             
             # self.logger.info("Retrieving existing files from Google Clouds...")
@@ -489,9 +482,12 @@ class AgentWrapper():
         """Process any existing uploaded files for Gemini models."""
         uploaded_mappings = self.client.server.cloud_file_mapping_manager.list_files_with_status(status='uploaded')
 
+        # Index the cloud files once instead of rescanning the whole list for every mapping
+        name_to_file = {file.name: file for file in self.existing_files}
+
         count = 0
         for mapping in uploaded_mappings:
-            file_ref = [file for file in self.existing_files if file.name == mapping.cloud_file_id][0]
+            file_ref = name_to_file[mapping.cloud_file_id]
 
             self.temp_message_accumulator.temporary_messages.append(
                 (mapping.timestamp, {'image_uris': [file_ref],
@@ -1515,16 +1511,19 @@ Please perform this analysis and create new memories as appropriate. Provide a d
             if image_uris is not None:
                 if isinstance(message, str):
                     message = [{'type': 'text', 'text': message}]
-                for image_uri in image_uris:
-                    mime_type = get_image_mime_type(image_uri)
-                    message.append({'type': 'image_data', 'image_data': {'data': f"data:{mime_type};base64,{encode_image(image_uri)}", 'detail': 'auto'}})
+                # The same image can be attached more than once; ship each one only once
+                for image_uri in dict.fromkeys(image_uris):
+                    if self.client._determine_file_type(image_uri).startswith('image/'):
+                        # Hand the path over directly: the client copies the file into its image store,
+                        # so there is no need to base64-encode it here only for the client to decode it again.
+                        message.append({'type': 'file_uri', 'file_uri': image_uri})
+                    else:
+                        mime_type = get_image_mime_type(image_uri)
+                        message.append({'type': 'image_data', 'image_data': {'data': f"data:{mime_type};base64,{encode_image(image_uri)}", 'detail': 'auto'}})
 
             # Only get recent images for chat context if user has enabled this feature
             if self.include_recent_screenshots:
 
-                if isinstance(message, str):
-                    message = [{'type': 'text', 'text': message}]
-
                 extra_messages = []
 
                 most_recent_images = self.temp_message_accumulator.get_recent_images_for_chat(current_timestamp=datetime.now(self.timezone))
@@ -1555,7 +1554,12 @@ Please perform this analysis and create new memories as appropriate. Provide a d
                         'text': f"Additional images (screenshots) from the system end here."
                     })
 
-                extra_messages = None if len(extra_messages) == 0 else extra_messages
+                if len(extra_messages) == 0:
+                    extra_messages = None
+                elif isinstance(message, str):
+                    # The client only converts extra_messages alongside a list-form message,
+                    # so wrap the text when there are screenshots to attach
+                    message = [{'type': 'text', 'text': message}]
 
             else:
                 extra_messages = None
@@ -1568,7 +1572,7 @@ Please perform this analysis and create new memories as appropriate. Provide a d
                     'message': message,
                     'display_intermediate_message': display_intermediate_message,
                     'force_response': True,
-                    'existing_file_uris': set(list(self.uri_to_create_time.keys())),
+                    'existing_file_uris': set(self.uri_to_create_time),
                     'extra_messages': extra_messages,
                 }, 
                 agent_type='chat',
@@ -1713,6 +1717,7 @@ Please perform this analysis and create new memories as appropriate. Provide a d
                 
             # Try to initialize Gemini client with the provided key
             try:
+                from google import genai
                 self.google_client = genai.Client(api_key=api_key)
                 
                 # Complete the initialization
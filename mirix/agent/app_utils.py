@@ -1,12 +1,14 @@
 import base64
 import io
 
+from mirix.llm_api.helpers import encode_file_to_base64
+
 # Convert images to base64
 def encode_image(image_path):
-    with open(image_path, "rb") as img_file:
-        return base64.b64encode(img_file.read()).decode("utf-8")
+    return encode_file_to_base64(image_path)
 
 def encode_image_from_pil(image):
     buffer = io.BytesIO()
     image.save(buffer, format="PNG")  # Change format if needed (JPEG, etc.)
-    return base64.b64encode(buffer.getvalue()).decode("utf-8")
\ No newline at end of file
+    # getbuffer() hands the encoder a view of the PNG bytes instead of copying them out first
+    return base64.b64encode(buffer.getbuffer()).decode("ascii")
\ No newline at end of file
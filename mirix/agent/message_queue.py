@@ -76,13 +76,11 @@ class MessageQueue:
             # Get current message type
             current_message_type = self.message_queue[message_uuid]['type']
             
-            # Find index of current message
-            message_keys = list(self.message_queue.keys())
-            idx = message_keys.index(message_uuid)
-            
-            # Check earlier messages of the same type
-            for i in range(idx):
-                earlier_message = self.message_queue[message_keys[i]]
+            # Walk the (insertion-ordered) queue once, stopping at the current message,
+            # instead of copying the keys and searching for its index on every poll
+            for key, earlier_message in self.message_queue.items():
+                if key == message_uuid:
+                    break
                 if earlier_message['type'] == current_message_type:
                     if not earlier_message['finished']:
                         return False
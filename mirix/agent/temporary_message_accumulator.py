@@ -572,10 +572,12 @@ class TemporaryMessageAccumulator:
         """Add user conversation to the message if it exists."""
         user_message_added = False
         if len(self.temporary_user_messages[-1]) > 0:
-            user_conversation = 'The following are the conversations between the user and the Chat Agent while capturing this content:\n'
-            for idx, user_message in enumerate(self.temporary_user_messages[-1]):
-                user_conversation += f"role: {user_message['role']}; content: {user_message['content']}\n"
-            user_conversation = user_conversation.strip()
+            lines = ['The following are the conversations between the user and the Chat Agent while capturing this content:']
+            lines.extend(
+                f"role: {user_message['role']}; content: {user_message['content']}"
+                for user_message in self.temporary_user_messages[-1]
+            )
+            user_conversation = "\n".join(lines).strip()
             
             message.append({
                 'type': 'text',
@@ -13,6 +13,8 @@ class UploadManager:
     Each upload gets a 10-second timeout and either succeeds or fails immediately.
     """
     
+    UPLOAD_TIMEOUT_SECONDS = 10.0
+    
     def __init__(self, google_client, client, existing_files, uri_to_create_time):
         self.google_client = google_client
         self.client = client
@@ -27,6 +29,10 @@ class UploadManager:
         self._upload_status = {}
         self._upload_lock = threading.Lock()
         
+        # upload_uuid -> time after which a pending upload is marked failed; compression time is added on top
+        self._upload_deadlines = {}
+        self._compressing = set()
+        
         # Thread pool for concurrent uploads (max 4 simultaneous uploads)
         self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="upload_worker")
     
@@ -52,23 +58,38 @@ class UploadManager:
             self.logger.error(f"Image compression failed for {image_path}: {e}")
             return None
     
-    def _upload_single_file(self, upload_uuid, filename, timestamp, compressed_file):
-        """Upload a single file with 5-second timeout"""
+    def _upload_single_file(self, upload_uuid, filename, timestamp, compress):
+        """Compress (if requested) and upload a single file with 10-second timeout"""
+        compressed_file = None
         try:
 
             # Check if file already exists in cloud
             if self.client.server.cloud_file_mapping_manager.check_if_existing(local_file_id=filename):
                 cloud_file_name = self.client.server.cloud_file_mapping_manager.get_cloud_file(local_file_id=filename)
-                file_ref = [x for x in self.existing_files if x.name == cloud_file_name][0]
+                file_ref = next(x for x in self.existing_files if x.name == cloud_file_name)
                 
                 with self._upload_lock:
                     self._upload_status[upload_uuid] = {'status': 'completed', 'result': file_ref}
                 return
             
+            # Compress here on the worker so the caller isn't blocked decoding/encoding the image
+            if compress and filename.lower().endswith(('.png', '.jpg', '.jpeg')):
+                compress_start_time = time.time()
+                with self._upload_lock:
+                    self._compressing.add(upload_uuid)
+                try:
+                    compressed_file = self._compress_image(filename)
+                finally:
+                    # Don't count compression against the upload timeout
+                    with self._upload_lock:
+                        self._compressing.discard(upload_uuid)
+                        if upload_uuid in self._upload_deadlines:
+                            self._upload_deadlines[upload_uuid] += time.time() - compress_start_time
+            
             # Choose file to upload (compressed if available, otherwise original)
             upload_file = compressed_file if compressed_file and os.path.exists(compressed_file) else filename
             
-            # Upload with 5-second timeout
+            # Upload with 10-second timeout
             upload_start_time = time.time()
             file_ref = self.google_client.files.upload(file=upload_file)
             upload_duration = time.time() - upload_start_time
@@ -113,26 +134,28 @@ class UploadManager:
         """Start an async upload and return immediately with a placeholder"""
         upload_uuid = str(uuid.uuid4())
         
-        # Compress image if requested
-        compressed_file = None
-        if compress and filename.lower().endswith(('.png', '.jpg', '.jpeg')):
-            compressed_file = self._compress_image(filename)
-        
         # Initialize status
         with self._upload_lock:
             self._upload_status[upload_uuid] = {'status': 'pending', 'result': None}
+            self._upload_deadlines[upload_uuid] = time.time() + self.UPLOAD_TIMEOUT_SECONDS
         
-        # Submit upload task with 5-second timeout
-        future = self._executor.submit(self._upload_single_file, upload_uuid, filename, timestamp, compressed_file)
+        # Submit upload task with 10-second timeout
+        future = self._executor.submit(self._upload_single_file, upload_uuid, filename, timestamp, compress)
         
         # Set up automatic timeout handling
         def timeout_handler():
-            time.sleep(10.0)  # Wait 10 seconds
-            with self._upload_lock:
-                if self._upload_status.get(upload_uuid, {}).get('status') == 'pending':
-                    self.logger.info(f"Upload timeout (5s) for {filename}, marking as failed")
-                    self._upload_status[upload_uuid] = {'status': 'failed', 'result': None}
-                    future.cancel()  # Try to cancel the upload
+            while True:
+                with self._upload_lock:
+                    remaining = self._upload_deadlines[upload_uuid] - time.time()
+                    # Keep waiting while the worker is still compressing; its time is added to the deadline afterwards
+                    if remaining <= 0 and upload_uuid not in self._compressing:
+                        self._upload_deadlines.pop(upload_uuid, None)
+                        if self._upload_status.get(upload_uuid, {}).get('status') == 'pending':
+                            self.logger.info(f"Upload timeout ({self.UPLOAD_TIMEOUT_SECONDS:.0f}s) for {filename}, marking as failed")
+                            self._upload_status[upload_uuid] = {'status': 'failed', 'result': None}
+                            future.cancel()  # Try to cancel the upload
+                        return
+                time.sleep(max(remaining, 0.1))
         
         # Start timeout handler in separate thread
         timeout_thread = threading.Thread(target=timeout_handler, daemon=True)
@@ -190,7 +213,8 @@ class UploadManager:
     def upload_file(self, filename, timestamp):
         """Legacy synchronous upload method"""
         placeholder = self.upload_file_async(filename, timestamp)
-        return self.wait_for_upload(placeholder, timeout=10)  # Reduced timeout since individual uploads timeout at 5s
+        # No tighter limit here: the timeout handler fails the upload once its deadline (10s plus compression time) passes
+        return self.wait_for_upload(placeholder)
     
     def cleanup_resolved_upload(self, placeholder):
         """Clean up resolved upload from tracking"""
@@ -31,6 +31,7 @@ MIN_CONTEXT_WINDOW = 4096
 # embeddings
 MAX_EMBEDDING_DIM = 4096  # maximum supported embeding size - do NOT change or else DBs will need to be reset
 DEFAULT_EMBEDDING_CHUNK_SIZE = 300
+QUERY_EMBEDDING_CACHE_SIZE = 32  # number of (embedding config, query text) pairs to memoize
 
 MAX_CHAINING_STEPS = 10
 MAX_RETRIEVAL_LIMIT_IN_SYSTEM = 10
@@ -191,4 +192,5 @@ CALL_MEMORY_AGENT_IN_PARALLEL = False
 CHAINING_FOR_MEMORY_UPDATE = False
 
 LOAD_IMAGE_CONTENT_FOR_LAST_MESSAGE_ONLY = False
+IMAGE_ENCODING_CACHE_MAX_BYTES = 64 * 1024 * 1024  # total size of base64-encoded local images kept in memory between LLM requests
 BUILD_EMBEDDINGS_FOR_MEMORY = True
\ No newline at end of file
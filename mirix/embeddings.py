@@ -1,10 +1,11 @@
 import uuid
+from functools import lru_cache
 from typing import Any, List, Optional
 
 import numpy as np
 import tiktoken
 
-from mirix.constants import EMBEDDING_TO_TOKENIZER_DEFAULT, EMBEDDING_TO_TOKENIZER_MAP, MAX_EMBEDDING_DIM
+from mirix.constants import EMBEDDING_TO_TOKENIZER_DEFAULT, EMBEDDING_TO_TOKENIZER_MAP, MAX_EMBEDDING_DIM, QUERY_EMBEDDING_CACHE_SIZE
 from mirix.schemas.embedding_config import EmbeddingConfig
 from mirix.utils import is_valid_url, printd
 
@@ -123,6 +124,9 @@ class EmbeddingEndpoint:
     def get_text_embedding(self, text: str) -> List[float]:
         return self._call_api(text)
 
+    def get_text_embedding_batch(self, texts: List[str]) -> List[List[float]]:
+        return [self._call_api(text) for text in texts]
+
 
 class AzureOpenAIEmbedding:
     def __init__(self, api_endpoint: str, api_key: str, api_version: str, model: str):
@@ -135,6 +139,10 @@ class AzureOpenAIEmbedding:
         embeddings = self.client.embeddings.create(input=[text], model=self.model).data[0].embedding
         return embeddings
 
+    def get_text_embedding_batch(self, texts: List[str]):
+        response = self.client.embeddings.create(input=texts, model=self.model)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
 
 class OllamaEmbeddings:
 
@@ -166,6 +174,9 @@ class OllamaEmbeddings:
         response_json = response.json()
         return response_json["embedding"]
 
+    def get_text_embedding_batch(self, texts: List[str]):
+        return [self.get_text_embedding(text) for text in texts]
+
 
 def query_embedding(embedding_model, query_text: str):
     """Generate padded embedding for querying database"""
@@ -260,3 +271,22 @@ def embedding_model(config: EmbeddingConfig, user_id: Optional[uuid.UUID] = None
 
     else:
         raise ValueError(f"Unknown endpoint type {endpoint_type}")
+
+
+@lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)
+def _cached_query_embedding(config_json: str, query_text: str) -> np.ndarray:
+    # Cache the unpadded vector as float32 (a few KB per entry) rather than the padded list of Python floats
+    config = EmbeddingConfig.model_validate_json(config_json)
+    query_vec = np.asarray(embedding_model(config).get_text_embedding(query_text), dtype=np.float32)
+    query_vec.setflags(write=False)
+    return query_vec
+
+
+def cached_query_embedding(config: EmbeddingConfig, query_text: str) -> List[float]:
+    """Generate padded query embedding, reusing results for repeated (config, query) pairs.
+
+    The same search text is often embedded several times in a row (e.g. once per memory type),
+    so memoizing here skips the duplicate round-trips to the embedding endpoint.
+    """
+    query_vec = _cached_query_embedding(config.model_dump_json(), query_text)
+    return np.pad(query_vec, (0, MAX_EMBEDDING_DIM - query_vec.shape[0]), mode="constant").tolist()
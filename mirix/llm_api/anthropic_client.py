@@ -23,7 +23,7 @@ from mirix.errors import (
     LLMUnprocessableEntityError,
 )
 from mirix.helpers.datetime_helpers import get_utc_time
-from mirix.llm_api.helpers import add_inner_thoughts_to_functions, unpack_all_inner_thoughts_from_kwargs
+from mirix.llm_api.helpers import add_inner_thoughts_to_functions, encode_file_to_base64, unpack_all_inner_thoughts_from_kwargs
 from mirix.llm_api.llm_client_base import LLMClientBase
 from mirix.constants import INNER_THOUGHTS_KWARG, INNER_THOUGHTS_KWARG_DESCRIPTION
 from mirix.log import get_logger
@@ -283,21 +283,19 @@ class AnthropicClient(LLMClientBase):
                             })
                         elif file.file_path is not None:
                             import mimetypes
-                            import base64
                             mime_type, _ = mimetypes.guess_type(file.file_path)
                             if mime_type is None or not mime_type.startswith('image/'):
                                 mime_type = 'image/jpeg'  # Default fallback
                             
-                            with open(file.file_path, "rb") as img_file:
-                                base64_data = base64.b64encode(img_file.read()).decode("utf-8")
-                                message_content.append({
-                                    'type': 'image',
-                                    'source': {
-                                        'type': 'base64',
-                                        'media_type': mime_type,
-                                        'data': base64_data,
-                                    }
-                                })
+                            base64_data = encode_file_to_base64(file.file_path)
+                            message_content.append({
+                                'type': 'image',
+                                'source': {
+                                    'type': 'base64',
+                                    'media_type': mime_type,
+                                    'data': base64_data,
+                                }
+                            })
                         else:
                             raise ValueError(f"File {file.file_path} has no source_url or file_path")
                         # global_image_idx += 1
@@ -307,23 +305,21 @@ class AnthropicClient(LLMClientBase):
                     local_path = self.cloud_file_mapping_manager.get_local_file(file.google_cloud_url)
                     
                     import mimetypes
-                    import base64
                     
                     # Get the MIME type of the image
                     mime_type, _ = mimetypes.guess_type(local_path)
                     if mime_type is None or not mime_type.startswith('image/'):
                         mime_type = 'image/jpeg'  # Default fallback
                     
-                    with open(local_path, "rb") as img_file:
-                        base64_data = base64.b64encode(img_file.read()).decode("utf-8")
-                        message_content.append({
-                            'type': 'image',
-                            'source': {
-                                'type': 'base64',
-                                'media_type': mime_type,
-                                'data': base64_data,
-                            }
-                        })
+                    base64_data = encode_file_to_base64(local_path)
+                    message_content.append({
+                        'type': 'image',
+                        'source': {
+                            'type': 'base64',
+                            'media_type': mime_type,
+                            'data': base64_data,
+                        }
+                    })
                 else:
                     message_content.append(m)
             message["content"] = message_content
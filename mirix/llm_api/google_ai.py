@@ -5,7 +5,6 @@ from typing import List, Optional, Tuple
 
 import requests
 
-import tiktoken
 from mirix.constants import NON_USER_MSG_PREFIX, MAX_IMAGES_TO_PROCESS
 from mirix.llm_api.helpers import make_post_request
 from mirix.schemas.openai.chat_completion_request import Tool
@@ -494,7 +493,3 @@ def google_ai_chat_completions_request(
         input_messages=data["contents"],
         pull_inner_thoughts_from_args=inner_thoughts_in_kwargs,
     )
-
-def count_tokens(s: str, model: str = "gpt-4") -> int:
-    encoding = tiktoken.encoding_for_model(model)
-    return len(encoding.encode(s))
\ No newline at end of file
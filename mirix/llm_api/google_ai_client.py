@@ -8,7 +8,7 @@ from google.genai.types import FunctionCallingConfig, FunctionCallingConfigMode,
 from mirix.constants import NON_USER_MSG_PREFIX
 from mirix.helpers.datetime_helpers import get_utc_time
 from mirix.helpers.json_helpers import json_dumps
-from mirix.llm_api.helpers import make_post_request
+from mirix.llm_api.helpers import encode_file_to_base64, make_post_request
 from mirix.llm_api.llm_client_base import LLMClientBase
 from mirix.utils import clean_json_string_extra_backslash, count_tokens
 from mirix.log import get_logger
@@ -183,10 +183,8 @@ class GoogleAIClient(LLMClientBase):
                             })
                         elif file.file_path is not None:
                             # Read from file path and convert to base64
-                            import base64
                             mime_type = file.file_type
-                            with open(file.file_path, "rb") as img_file:
-                                base64_data = base64.b64encode(img_file.read()).decode("utf-8")
+                            base64_data = encode_file_to_base64(file.file_path)
                             message_parts.append({
                                 "inline_data": {
                                     "mime_type": mime_type,
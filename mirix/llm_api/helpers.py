@@ -1,16 +1,26 @@
 import copy
 import json
+import mmap
+import os
+import threading
 import warnings
 from collections import OrderedDict
 from typing import Any, List, Union
 
+import orjson
 import requests
 
-from mirix.constants import OPENAI_CONTEXT_WINDOW_ERROR_SUBSTRING
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib codec
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+from mirix.constants import IMAGE_ENCODING_CACHE_MAX_BYTES, OPENAI_CONTEXT_WINDOW_ERROR_SUBSTRING
 from mirix.schemas.message import Message
 from mirix.schemas.openai.chat_completion_response import ChatCompletionResponse, Choice
 from mirix.settings import summarizer_settings
-from mirix.utils import count_tokens, json_dumps, printd
+from mirix.utils import DEBUG, count_tokens_batch, json_dumps, printd
 from mirix.schemas.enums import MessageRole
 
 
@@ -134,11 +144,94 @@ def convert_to_structured_output(openai_function: dict, allow_optional: bool = F
     return structured_output
 
 
+def _b64encode_file(file_path: str, size: int) -> bytes:
+    with open(file_path, "rb") as f:
+        if size == 0:
+            # mmap cannot map an empty file
+            return b""
+        # Encode straight from the page cache rather than copying the file into a bytes object first
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return base64.b64encode(mm)
+
+
+class _EncodedFileCache:
+    """LRU cache of encoded files, bounded by the total length of the cached strings rather than entry count."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value: str):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= len(self._entries.pop(key))
+            self._entries[key] = value
+            self._total_bytes += len(value)
+            while self._total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+
+
+_encoded_file_cache = _EncodedFileCache(IMAGE_ENCODING_CACHE_MAX_BYTES)
+
+
+def _encode_file_to_base64(file_path: str, mtime_ns: int, size: int) -> str:
+    key = (file_path, mtime_ns, size, None)
+    encoded = _encoded_file_cache.get(key)
+    if encoded is None:
+        encoded = _b64encode_file(file_path, size).decode("ascii")
+        _encoded_file_cache.put(key, encoded)
+    return encoded
+
+
+def encode_file_to_base64(file_path: str) -> str:
+    """Base64-encode a local file, reusing the result while the file is unchanged.
+
+    Images stay in the context window across many requests, so the same files are
+    re-encoded on every LLM call; the cache is keyed on (path, mtime, size) so an
+    edited file is picked up again.
+    """
+    stat = os.stat(file_path)
+    return _encode_file_to_base64(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+def _encode_file_to_data_url(file_path: str, mime_type: str, mtime_ns: int, size: int) -> str:
+    key = (file_path, mtime_ns, size, mime_type)
+    data_url = _encoded_file_cache.get(key)
+    if data_url is None:
+        data_url = f"data:{mime_type};base64," + _b64encode_file(file_path, size).decode("ascii")
+        _encoded_file_cache.put(key, data_url)
+    return data_url
+
+
+def encode_file_to_data_url(file_path: str, mime_type: str) -> str:
+    """Return a `data:<mime>;base64,...` URL for a local file, cached like `encode_file_to_base64`."""
+    stat = os.stat(file_path)
+    return _encode_file_to_data_url(file_path, mime_type, stat.st_mtime_ns, stat.st_size)
+
+
+# Shared session so repeated REST calls (e.g. Gemini) keep their connection alive
+_http_session = requests.Session()
+
+
 def make_post_request(url: str, headers: dict[str, str], data: dict[str, Any]) -> dict[str, Any]:
     printd(f"Sending request to {url}")
     try:
 
-        response = requests.post(url, headers=headers, json=data)
+        # Large image payloads make stdlib json the dominant CPU cost here, so serialize with orjson
+        headers = {"Content-Type": "application/json", **headers}
+        response = _http_session.post(url, headers=headers, data=orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
         printd(f"Response status code: {response.status_code}")
 
         # Raise for 4XX/5XX HTTP errors
@@ -149,7 +242,8 @@ def make_post_request(url: str, headers: dict[str, str], data: dict[str, Any]) -
         if "application/json" in content_type.lower():
             try:
                 response_data = response.json()  # Attempt to parse the response as JSON
-                printd(f"Response JSON: {response_data}")
+                if DEBUG:
+                    printd(f"Response JSON: {response_data}")
             except ValueError as json_err:
                 # Handle the case where the content type says JSON but the body is invalid
                 error_message = f"Failed to parse JSON despite Content-Type being {content_type}: {json_err}"
@@ -307,7 +401,8 @@ def calculate_summarizer_cutoff(in_context_messages: List[Message], token_counts
             f"Given in_context_messages has different length from given token_counts: {len(in_context_messages)} != {len(token_counts)}"
         )
 
-    in_context_messages_openai = [m.to_openai_dict() for m in in_context_messages]
+    # Only the roles are needed here, so skip serializing every message with to_openai_dict()
+    roles = [m.role for m in in_context_messages]
 
     if summarizer_settings.evict_all_messages:
         logger.info("Evicting all messages...")
@@ -321,25 +416,25 @@ def calculate_summarizer_cutoff(in_context_messages: List[Message], token_counts
 
         tokens_so_far = 0
         cutoff = 0
-        for i, msg in enumerate(in_context_messages_openai):
+        for i, role in enumerate(roles):
             # Skip system
             if i == 0:
                 continue
             cutoff = i
             tokens_so_far += token_counts[i]
 
-            if msg["role"] not in ["user", "tool", "function"] and tokens_so_far >= desired_token_count_to_summarize:
+            if role not in ["user", "tool", "function"] and tokens_so_far >= desired_token_count_to_summarize:
                 # Break if the role is NOT a user or tool/function and tokens_so_far is enough
                 break
             elif len(in_context_messages) - cutoff - 1 <= summarizer_settings.keep_last_n_messages:
                 # Also break if we reached the `keep_last_n_messages` threshold
                 # NOTE: This may be on a user, tool, or function in theory
                 logger.warning(
-                    f"Breaking summary cutoff early on role={msg['role']} because we hit the `keep_last_n_messages`={summarizer_settings.keep_last_n_messages}"
+                    f"Breaking summary cutoff early on role={role} because we hit the `keep_last_n_messages`={summarizer_settings.keep_last_n_messages}"
                 )
                 break
         
-        while in_context_messages_openai[cutoff + 1]['role'] == MessageRole.tool:
+        while roles[cutoff + 1] == MessageRole.tool:
             cutoff += 1
 
         logger.info(f"Evicting {cutoff}/{len(in_context_messages)} messages...")
@@ -348,7 +443,7 @@ def calculate_summarizer_cutoff(in_context_messages: List[Message], token_counts
 
 def get_token_counts_for_messages(in_context_messages: List[Message]) -> List[int]:
     in_context_messages_openai = [m.to_openai_dict() for m in in_context_messages]
-    token_counts = [count_tokens(str(msg)) for msg in in_context_messages_openai]
+    token_counts = count_tokens_batch([str(msg) for msg in in_context_messages_openai])
     return token_counts
 
 
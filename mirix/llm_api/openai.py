@@ -453,13 +453,15 @@ def openai_chat_completions_request_stream(
     api_key: str,
     chat_completion_request: ChatCompletionRequest,
 ) -> Generator[ChatCompletionChunkResponse, None, None]:
-    from mirix.utils import printd
+    from mirix.utils import DEBUG, printd
 
     url = smart_urljoin(url, "chat/completions")
     headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
     data = chat_completion_request.model_dump(exclude_none=True)
 
-    printd("Request:\n", json.dumps(data, indent=2))
+    if DEBUG:
+        # Pretty-printing the payload (which may carry base64 images) is expensive, so only do it when it will be shown
+        printd("Request:\n", json.dumps(data, indent=2))
 
     # If functions == None, strip from the payload
     if "functions" in data and data["functions"] is None:
@@ -523,7 +525,7 @@ def openai_chat_completions_request(
 
     https://platform.openai.com/docs/guides/text-generation?lang=curl
     """
-    from mirix.utils import printd
+    from mirix.utils import DEBUG, printd
 
     url = smart_urljoin(url, "chat/completions")
     headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
@@ -533,7 +535,8 @@ def openai_chat_completions_request(
     if chat_completion_request.tools is not None:
         data["parallel_tool_calls"] = False
 
-    printd("Request:\n", json.dumps(data, indent=2))
+    if DEBUG:
+        printd("Request:\n", json.dumps(data, indent=2))
 
     # If functions == None, strip from the payload
     if "functions" in data and data["functions"] is None:
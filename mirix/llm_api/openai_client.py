@@ -1,6 +1,6 @@
 import os
 import json
-import base64
+from functools import lru_cache
 from typing import List, Optional
 from mirix.utils import parse_json
 
@@ -20,7 +20,12 @@ from mirix.errors import (
     LLMServerError,
     LLMUnprocessableEntityError,
 )
-from mirix.llm_api.helpers import add_inner_thoughts_to_functions, convert_to_structured_output, unpack_all_inner_thoughts_from_kwargs
+from mirix.llm_api.helpers import (
+    add_inner_thoughts_to_functions,
+    convert_to_structured_output,
+    encode_file_to_data_url,
+    unpack_all_inner_thoughts_from_kwargs,
+)
 from mirix.llm_api.llm_client_base import LLMClientBase
 from mirix.constants import INNER_THOUGHTS_KWARG, INNER_THOUGHTS_KWARG_DESCRIPTION, INNER_THOUGHTS_KWARG_DESCRIPTION_GO_FIRST
 from mirix.log import get_logger
@@ -57,9 +62,14 @@ def encode_image(image_path: str) -> str:
         # Default to jpeg if we can't determine the type
         mime_type = 'image/jpeg'
     
-    with open(image_path, "rb") as img_file:
-        base64_string = base64.b64encode(img_file.read()).decode("utf-8")
-        return f"data:{mime_type};base64,{base64_string}"
+    return encode_file_to_data_url(image_path, mime_type)
+
+
+@lru_cache(maxsize=8)
+def _get_sync_client(api_key: str, base_url: Optional[str]) -> OpenAI:
+    # Reuse one client (and its connection pool) per key/endpoint so each request
+    # doesn't pay for a fresh TCP + TLS handshake.
+    return OpenAI(api_key=api_key, base_url=base_url)
 
 
 class OpenAIClient(LLMClientBase):
@@ -253,7 +263,7 @@ class OpenAIClient(LLMClientBase):
         """
         Performs underlying synchronous request to OpenAI API and returns raw response dict.
         """
-        client = OpenAI(**self._prepare_client_kwargs())
+        client = _get_sync_client(**self._prepare_client_kwargs())
         response: ChatCompletion = client.chat.completions.create(**request_data)
         return response.model_dump()
 
@@ -290,7 +300,7 @@ class OpenAIClient(LLMClientBase):
         """
         Performs underlying streaming request to OpenAI and returns the stream iterator.
         """
-        client = OpenAI(**self._prepare_client_kwargs())
+        client = _get_sync_client(**self._prepare_client_kwargs())
         response_stream: Stream[ChatCompletionChunk] = client.chat.completions.create(**request_data, stream=True)
         return response_stream
 
@@ -1,5 +1,6 @@
 import base64
 import sqlite3
+from functools import lru_cache
 from typing import Optional, Union
 
 import numpy as np
@@ -103,13 +104,25 @@ def validate_and_transform_embedding(
     return vec
 
 
+def _unit_vector(embedding, expected_dim: int = MAX_EMBEDDING_DIM) -> np.ndarray:
+    vec = validate_and_transform_embedding(embedding, expected_dim)
+    return vec / np.linalg.norm(vec)
+
+
+@lru_cache(maxsize=16)
+def _cached_unit_vector(embedding: bytes, expected_dim: int = MAX_EMBEDDING_DIM) -> np.ndarray:
+    # SQLite passes the same query embedding for every row of an ORDER BY cosine_distance(...)
+    # scan, so decode and normalize it once per query instead of once per row.
+    return _unit_vector(embedding, expected_dim)
+
+
 def cosine_distance(embedding1, embedding2, expected_dim=MAX_EMBEDDING_DIM):
     """
     Calculate cosine distance between two embeddings
 
     Args:
-        embedding1: First embedding
-        embedding2: Second embedding
+        embedding1: First embedding (the stored row embedding)
+        embedding2: Second embedding (the query embedding)
         expected_dim: Expected embedding dimension (default 4096)
 
     Returns:
@@ -121,11 +134,14 @@ def cosine_distance(embedding1, embedding2, expected_dim=MAX_EMBEDDING_DIM):
 
     try:
         vec1 = validate_and_transform_embedding(embedding1, expected_dim)
-        vec2 = validate_and_transform_embedding(embedding2, expected_dim)
+        if isinstance(embedding2, bytes):
+            unit2 = _cached_unit_vector(embedding2, expected_dim)
+        else:
+            unit2 = _unit_vector(embedding2, expected_dim)
     except ValueError:
         return 0.0
 
-    similarity = np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
+    similarity = np.dot(vec1, unit2) / np.linalg.norm(vec1)
     distance = float(1.0 - similarity)
 
     return distance
@@ -3,6 +3,7 @@ import traceback
 import base64
 import tempfile
 import json
+import orjson
 import yaml
 from pathlib import Path
 from datetime import datetime
@@ -15,6 +16,7 @@ import asyncio
 import queue
 import threading
 from ..agent.agent_wrapper import AgentWrapper
+from ..log import get_logger
 
 """
 VOICE RECORDING STRATEGY & ARCHITECTURE:
@@ -54,6 +56,8 @@ To fix it, install FFmpeg:
 The warning doesn't affect functionality as pydub falls back gracefully.
 """
 
+logger = get_logger(__name__)
+
 app = FastAPI(title="Mirix Agent API", version="0.1.1")
 
 # Add CORS middleware
@@ -333,6 +337,10 @@ async def send_message_endpoint(request: MessageRequest):
         print(f"Traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"Error processing message: {str(e)}")
 
+def _sse_event(payload: Dict[str, Any]) -> bytes:
+    """Encode one server-sent event; orjson returns UTF-8 bytes, so Starlette can write them as-is."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
 @app.post("/send_streaming_message")
 async def send_streaming_message_endpoint(request: MessageRequest):
     """Send a message to the agent and stream intermediate messages and final response"""
@@ -347,7 +355,7 @@ async def send_streaming_message_endpoint(request: MessageRequest):
     if api_key_check["missing_keys"]:
         # Return a special SSE event for missing API keys
         async def missing_keys_response():
-            yield f"data: {json.dumps({'type': 'missing_api_keys', 'missing_keys': api_key_check['missing_keys'], 'model_type': api_key_check['model_type']})}\n\n"
+            yield _sse_event({'type': 'missing_api_keys', 'missing_keys': api_key_check['missing_keys'], 'model_type': api_key_check['model_type']})
         
         return StreamingResponse(
             missing_keys_response(),
@@ -399,46 +407,45 @@ async def send_streaming_message_endpoint(request: MessageRequest):
                         if request.memorizing:
                             result_queue.put({"type": "final", "response": ""})
                         else:
-                            print("[DEBUG] Agent returned None response")
+                            logger.debug("Agent returned None response")
                             result_queue.put({"type": "error", "error": "Agent returned no response"})
                     elif isinstance(response, str) and response.startswith("ERROR_"):
                         # Handle specific error types from agent wrapper
-                        print(f"[DEBUG] Agent returned specific error: {response}")
+                        logger.debug(f"Agent returned specific error: {response}")
                         if response == "ERROR_RESPONSE_FAILED":
-                            print("[DEBUG] - Message queue response failed")
+                            logger.debug("Message queue response failed")
                             result_queue.put({"type": "error", "error": "Message processing failed in agent queue"})
                         elif response == "ERROR_INVALID_RESPONSE_STRUCTURE":
-                            print("[DEBUG] - Response structure invalid (missing messages or insufficient count)")
+                            logger.debug("Response structure invalid (missing messages or insufficient count)")
                             result_queue.put({"type": "error", "error": "Invalid response structure from agent"})
                         elif response == "ERROR_NO_TOOL_CALL":
-                            print("[DEBUG] - Expected message missing tool_call attribute")
+                            logger.debug("Expected message missing tool_call attribute")
                             result_queue.put({"type": "error", "error": "Agent response missing required tool call"})
                         elif response == "ERROR_NO_MESSAGE_IN_ARGS":
-                            print("[DEBUG] - Tool call arguments missing 'message' key")
+                            logger.debug("Tool call arguments missing 'message' key")
                             result_queue.put({"type": "error", "error": "Agent tool call missing message content"})
                         elif response == "ERROR_PARSING_EXCEPTION":
-                            print("[DEBUG] - Exception occurred during response parsing")
+                            logger.debug("Exception occurred during response parsing")
                             result_queue.put({"type": "error", "error": "Failed to parse agent response"})
                         else:
-                            print(f"[DEBUG] - Unknown error type: {response}")
+                            logger.debug(f"Unknown error type: {response}")
                             result_queue.put({"type": "error", "error": f"Unknown agent error: {response}"})
                     elif response == "ERROR":
-                        print("[DEBUG] Agent returned generic ERROR string")
+                        logger.debug("Agent returned generic ERROR string")
                         result_queue.put({"type": "error", "error": "Agent processing failed"})
                     elif not response or (isinstance(response, str) and response.strip() == ""):
                         if request.memorizing:
-                            print("[DEBUG] Agent returned empty response - expected for memorizing=True")
+                            logger.debug("Agent returned empty response - expected for memorizing=True")
                             result_queue.put({"type": "final", "response": ""})
                         else:
-                            print("[DEBUG] Agent returned empty response unexpectedly")
+                            logger.debug("Agent returned empty response unexpectedly")
                             result_queue.put({"type": "error", "error": "Agent returned empty response"})
                     else:
-                        print(f"[DEBUG] Agent returned successful response (length: {len(str(response))})")
+                        logger.debug(f"Agent returned successful response (length: {len(str(response))})")
                         result_queue.put({"type": "final", "response": response})
                         
                 except Exception as e:
-                    print(f"[DEBUG] Exception in run_agent: {str(e)}")
-                    print(f"Traceback: {traceback.format_exc()}")
+                    logger.exception("Exception in run_agent")
                     result_queue.put({"type": "error", "error": str(e)})
             
             # Start agent processing as async task
@@ -449,22 +456,25 @@ async def send_streaming_message_endpoint(request: MessageRequest):
             
             # Stream intermediate messages and wait for final result
             while not final_result_sent:
-                # Check for intermediate messages first
-                try:
-                    intermediate_msg = message_queue.get_nowait()
-                    yield f"data: {json.dumps(intermediate_msg)}\n\n"
+                # Drain all pending intermediate messages and send them as one write;
+                # the client splits frames on newlines, so several events can share a chunk
+                pending_frames = []
+                while True:
+                    try:
+                        pending_frames.append(_sse_event(message_queue.get_nowait()))
+                    except queue.Empty:
+                        break
+                if pending_frames:
+                    yield b"".join(pending_frames)
                     continue  # Continue to next iteration to check for more messages
-                except queue.Empty:
-                    pass
                 
-                # Check for final result with timeout
+                # Check for final result without blocking the event loop; the sleep below paces the polling
                 try:
-                    # Use a short timeout to allow for intermediate messages
-                    final_result = result_queue.get(timeout=0.1)
+                    final_result = result_queue.get_nowait()
                     if final_result["type"] == "error":
-                        yield f"data: {json.dumps({'type': 'error', 'error': final_result['error']})}\n\n"
+                        yield _sse_event({'type': 'error', 'error': final_result['error']})
                     else:
-                        yield f"data: {json.dumps({'type': 'final', 'response': final_result['response']})}\n\n"
+                        yield _sse_event({'type': 'final', 'response': final_result['response']})
                     final_result_sent = True
                     break
                 except queue.Empty:
@@ -475,9 +485,9 @@ async def send_streaming_message_endpoint(request: MessageRequest):
                             # Check if the task raised an exception
                             agent_task.result()
                         except Exception as e:
-                            yield f"data: {json.dumps({'type': 'error', 'error': f'Agent processing failed: {str(e)}'})}\n\n"
+                            yield _sse_event({'type': 'error', 'error': f'Agent processing failed: {str(e)}'})
                         else:
-                            yield f"data: {json.dumps({'type': 'error', 'error': 'Agent processing completed unexpectedly without result'})}\n\n"
+                            yield _sse_event({'type': 'error', 'error': 'Agent processing completed unexpectedly without result'})
                         final_result_sent = True
                         break
                     # Otherwise continue the loop to check for more intermediate messages
@@ -489,11 +499,11 @@ async def send_streaming_message_endpoint(request: MessageRequest):
                     await asyncio.wait_for(agent_task, timeout=5.0)
                 except asyncio.TimeoutError:
                     agent_task.cancel()
-                    yield f"data: {json.dumps({'type': 'error', 'error': 'Agent processing timed out'})}\n\n"
+                    yield _sse_event({'type': 'error', 'error': 'Agent processing timed out'})
             
         except Exception as e:
             print(f"Traceback: {traceback.format_exc()}")
-            yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
+            yield _sse_event({'type': 'error', 'error': str(e)})
     
     try:
         return StreamingResponse(
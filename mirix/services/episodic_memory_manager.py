@@ -224,8 +224,7 @@ class EpisodicMemoryManager:
             if BUILD_EMBEDDINGS_FOR_MEMORY:
                 # TODO: need to check if we need to chunk the text
                 embed_model = embedding_model(agent_state.embedding_config)
-                details_embedding = embed_model.get_text_embedding(details)
-                summary_embedding = embed_model.get_text_embedding(summary)
+                details_embedding, summary_embedding = embed_model.get_text_embedding_batch([details, summary])
                 embedding_config = agent_state.embedding_config
             else:
                 details_embedding = None
@@ -670,8 +670,7 @@ class ProceduralMemoryManager:
             if BUILD_EMBEDDINGS_FOR_MEMORY:
                 # TODO: need to check if we need to chunk the text
                 embed_model = embedding_model(agent_state.embedding_config)
-                summary_embedding = embed_model.get_text_embedding(summary)
-                steps_embedding = embed_model.get_text_embedding("\n".join(steps))
+                summary_embedding, steps_embedding = embed_model.get_text_embedding_batch([summary, "\n".join(steps)])
                 embedding_config = agent_state.embedding_config
             else:
                 summary_embedding = None
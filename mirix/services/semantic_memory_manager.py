@@ -663,9 +663,7 @@ class SemanticMemoryManager:
             if BUILD_EMBEDDINGS_FOR_MEMORY:
                 # TODO: need to check if we need to chunk the text
                 embed_model = embedding_model(agent_state.embedding_config)
-                name_embedding = embed_model.get_text_embedding(name)
-                summary_embedding = embed_model.get_text_embedding(summary)
-                details_embedding = embed_model.get_text_embedding(details)
+                name_embedding, summary_embedding, details_embedding = embed_model.get_text_embedding_batch([name, summary, details])
                 embedding_config = agent_state.embedding_config
             else:
                 name_embedding = None
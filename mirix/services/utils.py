@@ -1,14 +1,12 @@
-import numpy as np
 from typing import List, Optional, Dict, Any
 from mirix.constants import (
     CORE_MEMORY_TOOLS, BASE_TOOLS, 
-    MAX_EMBEDDING_DIM, 
     EPISODIC_MEMORY_TOOLS, PROCEDURAL_MEMORY_TOOLS,
     RESOURCE_MEMORY_TOOLS, KNOWLEDGE_VAULT_TOOLS, META_MEMORY_TOOLS
 )
 from mirix.orm.sqlite_functions import adapt_array
 from mirix.schemas.embedding_config import EmbeddingConfig
-from mirix.embeddings import embedding_model, parse_and_chunk_text
+from mirix.embeddings import cached_query_embedding, parse_and_chunk_text
 from sqlalchemy import Select, func, literal, select, union_all
 from functools import wraps
 import pytz
@@ -30,9 +28,7 @@ def build_query(base_query,
             if embedded_text is None:
                 assert embedding_config is not None, "embedding_config must be specified for vector search"
                 assert query_text is not None, "query_text must be specified for vector search"
-                embedded_text = embedding_model(embedding_config).get_text_embedding(query_text)
-                embedded_text = np.array(embedded_text)
-                embedded_text = np.pad(embedded_text, (0, MAX_EMBEDDING_DIM - embedded_text.shape[0]), mode="constant").tolist()
+                embedded_text = cached_query_embedding(embedding_config, query_text)
 
         main_query = base_query.order_by(None)
 
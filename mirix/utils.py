@@ -15,7 +15,7 @@ import sys
 import uuid
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import List, Union, _GenericAlias, get_args, get_origin, get_type_hints
 from urllib.parse import urljoin, urlparse
 
@@ -808,9 +808,30 @@ class OpenAIBackcompatUnpickler(pickle.Unpickler):
         return super().find_class(module, name)
 
 
+@lru_cache(maxsize=16)
+def get_encoding_for_model(model: str) -> tiktoken.Encoding:
+    """Return the tiktoken encoding for `model`, falling back to cl100k_base for unknown models.
+
+    Token counting runs on every message, so the model-name resolution is done once per model.
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        printd(f"Warning: model {model} not found. Using cl100k_base encoding.")
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def count_tokens(s: str, model: str = "gpt-4") -> int:
-    encoding = tiktoken.encoding_for_model(model)
-    return len(encoding.encode(s))
+    encoding = get_encoding_for_model(model)
+    # Only the length is needed: encode_ordinary skips the special-token scan (and its
+    # ValueError on text that happens to contain e.g. "<|endoftext|>")
+    return len(encoding.encode_ordinary(s))
+
+
+def count_tokens_batch(texts: List[str], model: str = "gpt-4") -> List[int]:
+    """Token counts for many strings in one call; tiktoken tokenizes the batch on its own thread pool."""
+    encoding = get_encoding_for_model(model)
+    return [len(tokens) for tokens in encoding.encode_ordinary_batch(texts)]
 
 
 def printd(*args, **kwargs):
@@ -1192,13 +1213,7 @@ def num_tokens_from_functions(functions: List[dict], model: str = "gpt-4"):
 
     Copied from https://community.openai.com/t/how-to-calculate-the-tokens-when-using-function-call/266573/11
     """
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        from mirix.utils import printd
-
-        printd(f"Warning: model not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
+    encoding = get_encoding_for_model(model)
 
     num_tokens = 0
     for function in functions:
@@ -1256,11 +1271,7 @@ def num_tokens_from_tool_calls(tool_calls: Union[List[dict], List[ToolCall]], mo
         }
     }]
     """
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        # print("Warning: model not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
+    encoding = get_encoding_for_model(model)
 
     num_tokens = 0
     for tool_call in tool_calls:
@@ -1302,12 +1313,7 @@ def num_tokens_from_messages(messages: List[dict], model: str = "gpt-4") -> int:
     For counting tokens in function calling REQUESTS, see:
         https://community.openai.com/t/how-to-calculate-the-tokens-when-using-function-call/266573/11
     """
-    try:
-        # Attempt to search for the encoding based on the model string
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        # print("Warning: model not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
+    encoding = get_encoding_for_model(model)
     if model in {
         "gpt-3.5-turbo-0613",
         "gpt-3.5-turbo-16k-0613",
@@ -1419,10 +1425,6 @@ def clean_json_string_extra_backslash(s):
     return s
 
 
-def count_tokens(s: str, model: str = "gpt-4") -> int:
-    encoding = tiktoken.encoding_for_model(model)
-    return len(encoding.encode(s))
-
 def generate_short_id(prefix="id", length=4):
     """
     Generate a short, LLM-friendly ID.
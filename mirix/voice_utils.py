@@ -1,11 +1,14 @@
 import os
 import base64
 import tempfile
-from pydub import AudioSegment
-import speech_recognition as sr
+
+# pydub and speech_recognition are imported inside the functions below so that
+# importing the agent doesn't pay for them unless voice input is actually used.
 
 def convert_base64_to_audio_segment(voice_file_b64):
     """Convert base64 voice data to AudioSegment using temporary file"""
+    from pydub import AudioSegment
+
     try:
         # Convert base64 to AudioSegment using temporary file
         audio_data = base64.b64decode(voice_file_b64)
@@ -32,6 +35,8 @@ def process_voice_files(voice_items):
     if not voice_items:
         return None
     
+    import speech_recognition as sr
+    
     print(f"🎵 Agent processing {len(voice_items)} voice files")
     temp_files = []
     